@@ -2,5 +2,6 @@
 python ebay_scrape.py --headless --stdout-short
 rem python ebay_scrape.py --stdout-short
 rem python ebay_scrape.py --all-orders --headless
+rem python ebay_scrape.py --headless --daemon
 
 
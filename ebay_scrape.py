@@ -5,29 +5,140 @@ from __future__ import annotations
 
 import argparse
 import csv
+import json
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from urllib.parse import urlparse
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
 
 
 AWAITING_URL = "https://www.ebay.com/sh/ord/?filter=status:AWAITING_SHIPMENT"
 ALL_ORDERS_URL = "https://www.ebay.com/sh/ord/?filter=status:ALL_ORDERS"
 
-RE_ORDER_FULL = re.compile(r"^\d{2}-\d{5}-\d{5}$")   # e.g. 27-13984-70927
+RE_ITM = re.compile(r"/itm/(\d+)")
+RE_ORDER_FULL = re.compile(r"\d{2}-(\d{5})-(\d{5})")   # e.g. 27-13984-70927 (use fullmatch)
 RE_AVAILABLE = re.compile(r"\((\d+)\s+available\)", re.IGNORECASE)
 RE_PRICE = re.compile(r"\$?\s*([0-9]+(?:\.[0-9]{2})?)")
 
+# bound methods for the per-row parsers (skips the attribute lookup per call)
+_FULLMATCH_ORDER = RE_ORDER_FULL.fullmatch
+_SEARCH_AVAIL = RE_AVAILABLE.search
+_SEARCH_PRICE = RE_PRICE.search
+
+# Blocked via CDP to cut page-load bytes. Trackers are always blocked; assets only
+# in headless runs, since a visible window may be the sign-in/captcha page.
+BLOCKED_TRACKER_PATTERNS = ["*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*"]
+BLOCKED_ASSET_PATTERNS = ["*.jpg", "*.jpeg", "*.png", "*.webp", "*.gif", "*.svg", "*.woff", "*.woff2"]
+
 # Title filter (default: only keep items whose title contains "manual", case-insensitive)
 RE_MANUAL = re.compile(r"\b(manual|guide|handbook)\b", re.IGNORECASE)
 
+# DOM selectors used by JS_EXTRACT_ROWS (passed in as its argument)
+ROW_SELECTORS = {
+    "item_anchor": "a[href*='/itm/']",
+    "order_anchor": "a[href*='/mesh/ord/details']",
+    "avail": "span[class*='available-quantity']",
+    "price": "div.price-column-item",
+}
+
+# Runs in the browser and returns one plain object per /itm/ anchor, so the
+# whole table costs a single WebDriver round-trip instead of ~8 per anchor.
+# Row lookup: walk up the DOM (max 12 hops) until we reach something row-ish.
+# eBay changes markup; this heuristic keeps it robust.
+JS_EXTRACT_ROWS = r"""
+function (sel) {
+    function text(el) {
+        return el ? (el.innerText || "").trim() : "";
+    }
+
+    function findRow(el) {
+        var cur = el;
+        for (var i = 0; i < 12 && cur; i++) {
+            var tag = (cur.tagName || "").toLowerCase();
+            var cls = (cur.getAttribute("class") || "").toLowerCase();
+            var role = (cur.getAttribute("role") || "").toLowerCase();
+            if (tag === "tr") return cur;
+            if (role === "row" || role === "rowgroup") return cur;
+            if (cls.indexOf("row") !== -1 || cls.indexOf("card") !== -1) return cur;
+            cur = cur.parentElement;
+        }
+        return el;
+    }
+
+    function findOrderText(row) {
+        var links = row.querySelectorAll(sel.order_anchor);
+        for (var i = 0; i < links.length; i++) {
+            if ((links[i].textContent || "").indexOf("-") !== -1) return text(links[i]);
+        }
+        // fallback: first anchor with any text
+        var anchors = row.querySelectorAll("a");
+        for (var j = 0; j < anchors.length; j++) {
+            if ((anchors[j].textContent || "").trim()) return text(anchors[j]);
+        }
+        return "";
+    }
+
+    var strongs = null;
+
+    function findSoldText(span) {
+        // prefer immediate preceding sibling <strong>, else nearest preceding <strong>
+        for (var sib = span.previousElementSibling; sib; sib = sib.previousElementSibling) {
+            if (sib.tagName === "STRONG") return text(sib);
+        }
+        strongs = strongs || document.querySelectorAll("strong");
+        for (var i = strongs.length - 1; i >= 0; i--) {
+            var pos = strongs[i].compareDocumentPosition(span);
+            if ((pos & Node.DOCUMENT_POSITION_FOLLOWING) && !(pos & Node.DOCUMENT_POSITION_CONTAINED_BY)) {
+                return text(strongs[i]);
+            }
+        }
+        return "";
+    }
+
+    var out = [];
+    var seen = new Map();   // item id -> index in out
+    var anchors = document.querySelectorAll(sel.item_anchor);
+    for (var k = 0; k < anchors.length; k++) {
+        var a = anchors[k];
+        var href = a.href || "";
+        var m = /\/itm\/(\d+)/.exec(href);
+        if (!m) continue;
+
+        // eBay renders the same item in several nodes (e.g. image + title link);
+        // keep one entry per item id, upgrading it if the first one had no title
+        var title = text(a);
+        var idx = seen.has(m[1]) ? seen.get(m[1]) : -1;
+        if (idx !== -1 && (out[idx].title || !title)) continue;
+
+        var row = findRow(a);
+        var avail = row.querySelector(sel.avail);
+        var entry = {
+            href: href,
+            title: title,
+            order_full: findOrderText(row),
+            avail_text: text(avail),
+            qty_sold_text: avail ? findSoldText(avail) : "",
+            price_text: text(row.querySelector(sel.price))
+        };
+        if (idx === -1) {
+            seen.set(m[1], out.length);
+            out.push(entry);
+        } else {
+            out[idx] = entry;
+        }
+    }
+    return out;
+}
+"""
+
 
 @dataclass(frozen=True)
 class AccountSpec:
@@ -35,46 +146,82 @@ class AccountSpec:
     profile_dir: Path
 
 
-def ensure_logged_in_or_pause(driver):
+def ensure_logged_in_or_pause(driver, interactive=True, account_name="") -> bool:
+    """
+    Pause for a manual sign-in if eBay redirected to the login page.
+    Without a console (interactive=False, e.g. a worker process) only warn and
+    return False so the caller can skip the account.
+    """
     cur = (driver.current_url or "").lower()
     if "signin" in cur or "login" in cur:
+        if not interactive:
+            print(f"[{account_name}] redirected to sign-in; skipping, no rows scraped. Run without --headless to log in.")
+            return False
         print("Redirected to sign-in. Please log in in the Chrome window, then press Enter here.")
         input()
+    return True
 
 
-def scroll_to_bottom(driver, steps=6, pause_s=0.5):
-    import time
-    for _ in range(steps):
-        driver.execute_script("window.scrollBy(0, document.body.scrollHeight);")
-        time.sleep(pause_s)
+def scroll_to_bottom(driver, max_steps=10, settle_s=1.0, first_settle_s=3.0):
+    """
+    Scroll until the number of /itm/ anchors stops growing (or max_steps is reached).
+    Each step waits only until new anchors appear, at most settle_s, instead of
+    sleeping a fixed time. While no anchors exist yet the wait is first_settle_s,
+    since Seller Hub can take a few seconds to fill the table after <body> is present.
+    """
+    count_js = "return document.querySelectorAll(arguments[0]).length;"
+    sel = ROW_SELECTORS["item_anchor"]
+    count = driver.execute_script(count_js, sel)
+
+    def grown(d):
+        n = d.execute_script(count_js, sel)
+        return n if n > count else False
+
+    for _ in range(max_steps):
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        budget = first_settle_s if count == 0 else settle_s
+        try:
+            count = WebDriverWait(driver, budget, poll_frequency=0.2).until(grown)
+        except TimeoutException:
+            break
+
+
+def evaluate_js(driver, expression: str):
+    """
+    Evaluate a JS expression via CDP Runtime.evaluate with returnByValue, so the
+    result comes back as plain JSON without WebDriver's element translation.
+    Raises JavascriptException if the script throws.
+    """
+    res = driver.execute_cdp_cmd("Runtime.evaluate", {
+        "expression": expression,
+        "returnByValue": True,
+        "awaitPromise": False,
+    })
+    details = res.get("exceptionDetails")
+    if details:
+        raise JavascriptException(details.get("exception", {}).get("description") or details.get("text"))
+    return res.get("result", {}).get("value")
 
 
 def extract_item_id_from_url(href: str) -> str | None:
-    try:
-        path = urlparse(href).path
-    except Exception:
-        path = href
-    m = re.search(r"/itm/(\d+)", path)
+    m = RE_ITM.search(href or "")
     return m.group(1) if m else None
 
 
 def extract_short_order(full_text: str) -> str | None:
-    t = (full_text or "").strip()
-    if not RE_ORDER_FULL.match(t):
-        return None
-    parts = t.split("-")
-    return f"{parts[1]}-{parts[2]}" if len(parts) == 3 else None
+    m = _FULLMATCH_ORDER((full_text or "").strip())
+    return f"{m.group(1)}-{m.group(2)}" if m else None
 
 
 def parse_qty_available(text: str) -> int | None:
-    m = RE_AVAILABLE.search(text or "")
+    m = _SEARCH_AVAIL(text or "")
     return int(m.group(1)) if m else None
 
 
 def parse_price(text: str) -> float | None:
     if not text:
         return None
-    m = RE_PRICE.search(text.replace(",", ""))
+    m = _SEARCH_PRICE(text.replace(",", ""))
     if not m:
         return None
     try:
@@ -83,135 +230,58 @@ def parse_price(text: str) -> float | None:
         return None
 
 
-def find_row_container(el, max_hops=12):
-    """
-    Walk up the DOM until we reach something row-ish.
-    eBay changes markup; this heuristic keeps it robust.
-    """
-    cur = el
-    for _ in range(max_hops):
-        try:
-            tag = cur.tag_name.lower()
-            cls = (cur.get_attribute("class") or "").lower()
-            role = (cur.get_attribute("role") or "").lower()
-
-            if tag == "tr":
-                return cur
-            if role in ("row", "rowgroup"):
-                return cur
-            if "row" in cls or "card" in cls:
-                return cur
-
-            cur = cur.find_element(By.XPATH, "..")
-        except Exception:
-            break
-    return el
-
-
-def safe_find_text(root, by, sel) -> str:
-    try:
-        return (root.find_element(by, sel).text or "").strip()
-    except Exception:
-        return ""
-
-
 def scrape_orders(driver, timeout=30, max_items=500, debug=False):
     wait = WebDriverWait(driver, timeout)
     wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
 
     # helps with lazy-rendered rows
-    scroll_to_bottom(driver, steps=6, pause_s=0.5)
+    scroll_to_bottom(driver)
 
-    item_links = driver.find_elements(By.XPATH, "//a[contains(@href,'/itm/')]")
+    # one WebDriver round-trip for the whole table; parsing stays in Python
+    raw_rows = evaluate_js(driver, f"({JS_EXTRACT_ROWS})({json.dumps(ROW_SELECTORS)})") or []
     if debug:
-        print(f"Found /itm/ anchors: {len(item_links)}")
+        print(f"Found unique /itm/ anchors: {len(raw_rows)}")
 
     rows = []
-    seen = set()
-
-    for a in item_links:
-        try:
-            href = (a.get_attribute("href") or "").strip()
-            title = (a.text or "").strip()
-
-            item_id = extract_item_id_from_url(href)
-            if not item_id:
-                continue
-
-            key = (item_id, title)
-            if key in seen:
-                continue
-            seen.add(key)
-
-            row = find_row_container(a)
-
-            # order number anchor
-            order_full = ""
-            try:
-                order_el = row.find_element(
-                    By.XPATH,
-                    ".//a[contains(@href,'/mesh/ord/details') and contains(normalize-space(.),'-')]"
-                )
-                cand = (order_el.text or "").strip()
-                if RE_ORDER_FULL.match(cand):
-                    order_full = cand
-            except Exception:
-                # fallback: any anchor matching the pattern
-                try:
-                    order_el = row.find_element(By.XPATH, ".//a[normalize-space(.)]")
-                    cand = (order_el.text or "").strip()
-                    if RE_ORDER_FULL.match(cand):
-                        order_full = cand
-                except Exception:
-                    order_full = ""
-
-            order_short = extract_short_order(order_full) if order_full else None
 
-            # quantity sold & available
-            qty_sold = None
-            qty_avail = None
+    # anchors arrive already deduplicated on item_id by the JS side
+    for raw in raw_rows:
+        href = (raw.get("href") or "").strip()
+        title = (raw.get("title") or "").strip()
 
-            try:
-                avail_span = row.find_element(By.XPATH, ".//span[contains(@class,'available-quantity')]")
-                avail_text = (avail_span.text or "").strip()
-                qty_avail = parse_qty_available(avail_text)
-
-                # prefer immediate preceding sibling <strong>, else nearest preceding <strong>
-                try:
-                    strong_el = avail_span.find_element(By.XPATH, "./preceding-sibling::strong[1]")
-                except Exception:
-                    strong_el = row.find_element(
-                        By.XPATH,
-                        ".//span[contains(@class,'available-quantity')]/preceding::strong[1]"
-                    )
-
-                s = (strong_el.text or "").strip()
-                qty_sold = int(s) if s.isdigit() else None
-            except Exception:
-                pass
-
-            # price
-            price_text = safe_find_text(row, By.CSS_SELECTOR, "div.price-column-item")
-            price = parse_price(price_text)
-
-            rows.append({
-                "order_number": order_short or "",
-                "order_full": order_full or "",
-                "item_id": item_id or "",
-                "title": title or "",
-                "item_url": href or "",
-                "qty_sold": "" if qty_sold is None else str(qty_sold),
-                "qty_available": "" if qty_avail is None else str(qty_avail),
-                "price": "" if price is None else f"{price:.2f}",
-                "price_text": price_text or "",
-            })
-
-            if len(rows) >= max_items:
-                break
-
-        except StaleElementReferenceException:
+        item_id = extract_item_id_from_url(href)
+        if not item_id:
             continue
 
+        # order number anchor
+        cand = (raw.get("order_full") or "").strip()
+        order_full = cand if _FULLMATCH_ORDER(cand) else ""
+        order_short = extract_short_order(order_full) if order_full else None
+
+        # quantity sold & available
+        qty_avail = parse_qty_available((raw.get("avail_text") or "").strip())
+        s = (raw.get("qty_sold_text") or "").strip()
+        qty_sold = int(s) if s.isdigit() else None
+
+        # price
+        price_text = (raw.get("price_text") or "").strip()
+        price = parse_price(price_text)
+
+        rows.append({
+            "order_number": order_short or "",
+            "order_full": order_full or "",
+            "item_id": item_id or "",
+            "title": title or "",
+            "item_url": href or "",
+            "qty_sold": "" if qty_sold is None else str(qty_sold),
+            "qty_available": "" if qty_avail is None else str(qty_avail),
+            "price": "" if price is None else f"{price:.2f}",
+            "price_text": price_text or "",
+        })
+
+        if len(rows) >= max_items:
+            break
+
     return rows
 
 
@@ -221,24 +291,13 @@ def filter_out_phantom_rows(rows):
     Typical signature: title is empty AND order fields empty
     (often also price/qty empty).
     Keep rows even if order_* is blank, as long as title exists.
+    Values are already stripped by scrape_orders.
     """
     out = []
+    append = out.append
     for r in rows:
-        title = (r.get("title") or "").strip()
-        order_full = (r.get("order_full") or "").strip()
-        order_number = (r.get("order_number") or "").strip()
-        price_text = (r.get("price_text") or "").strip()
-        qty_sold = (r.get("qty_sold") or "").strip()
-        qty_avail = (r.get("qty_available") or "").strip()
-
-        if (not title) and (not order_full) and (not order_number) and (not price_text) and (not qty_sold) and (not qty_avail):
-            continue
-
-        if (not title) and (not order_full) and (not order_number):
-            continue
-
-        out.append(r)
-
+        if r.get("title") or r.get("order_full") or r.get("order_number"):
+            append(r)
     return out
 
 
@@ -261,18 +320,17 @@ def print_table(rows, headers=None, max_widths=None):
     if headers is None:
         headers = list(rows[0].keys())
 
-    widths = {h: len(h) for h in headers}
-    for r in rows:
-        for h in headers:
-            widths[h] = max(widths[h], len(str(r.get(h, ""))))
+    # stringify each cell once; reused for widths and printing
+    srows = [{h: str(r.get(h, "")) for h in headers} for r in rows]
+
+    widths = {h: max(len(h), max((len(r[h]) for r in srows), default=0)) for h in headers}
 
     if max_widths:
         for h, cap in max_widths.items():
             if h in widths:
                 widths[h] = min(widths[h], cap)
 
-    def fmt_cell(h, v):
-        s = str(v)
+    def fmt_cell(h, s):
         cap = widths[h]
         if len(s) > cap:
             s = s[: max(0, cap - 1)] + "…"
@@ -283,18 +341,19 @@ def print_table(rows, headers=None, max_widths=None):
 
     print(sep.join(h.ljust(widths[h]) for h in headers))
     print(line)
-    for r in rows:
-        print(sep.join(fmt_cell(h, r.get(h, "")) for h in headers))
+    for r in srows:
+        print(sep.join(fmt_cell(h, r[h]) for h in headers))
 
 
-def write_csv(rows, path: Path):
+def write_csv(rows, path: Path, headers=None):
     if not rows:
         return
-    headers = list(rows[0].keys())
+    if headers is None:
+        headers = list(rows[0].keys())
     with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=headers)
-        w.writeheader()
-        w.writerows(rows)
+        w = csv.writer(f)
+        w.writerow(headers)
+        w.writerows([r.get(h, "") for h in headers] for r in rows)
 
 
 def build_driver(profile_dir: Path, headless: bool, chrome_binary: str | None = None):
@@ -305,36 +364,152 @@ def build_driver(profile_dir: Path, headless: bool, chrome_binary: str | None =
     if chrome_binary:
         options.binary_location = chrome_binary
 
+    # skip extensions and /dev/shm limits
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-dev-shm-usage")
+
     if headless:
         options.add_argument("--headless=new")
         options.add_argument("--window-size=1400,900")
+        options.add_argument("--disable-gpu")
+        # we only read text; a visible window may be the sign-in/captcha page, which needs images
+        options.add_argument("--blink-settings=imagesEnabled=false")
+
+    driver = webdriver.Chrome(options=options)
+    # explicit waits only; an implicit wait would stack on top of them
+    driver.implicitly_wait(0)
+    blocked = BLOCKED_TRACKER_PATTERNS + (BLOCKED_ASSET_PATTERNS if headless else [])
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked})
+    return driver
+
 
-    return webdriver.Chrome(options=options)
+def scrape_with_driver(driver, account: AccountSpec, url: str, args, interactive=True) -> list[dict]:
+    if args.debug:
+        print(f"\n=== Account: {account.name} | Profile: {account.profile_dir} ===")
 
+    driver.get(url)
+    if not ensure_logged_in_or_pause(driver, interactive=interactive, account_name=account.name):
+        return []
+    driver.get(url)
 
-def scrape_account(account: AccountSpec, url: str, args) -> list[dict]:
+    rows = scrape_orders(driver, timeout=args.timeout, max_items=args.max_items, debug=args.debug)
+    rows = filter_out_phantom_rows(rows)
+
+    # Add account column for downstream scripts / traceability
+    for r in rows:
+        r["account"] = account.name
+
+    # Keep only manuals (default)
+    rows = filter_rows_by_manual(rows, enabled=not args.no_manual_filter)
+
+    return rows
+
+
+def scrape_account(account: AccountSpec, url: str, args, interactive=True) -> list[dict]:
     driver = build_driver(account.profile_dir, headless=args.headless, chrome_binary=args.chrome_binary)
     try:
-        if args.debug:
-            print(f"\n=== Account: {account.name} | Profile: {account.profile_dir} ===")
+        return scrape_with_driver(driver, account, url, args, interactive=interactive)
+    finally:
+        driver.quit()
+
+
+def emit_results(combined_rows: list[dict], args, all_orders: bool, out_dir: Path):
+    # stable column order for CSV output
+    # (ensure "account" is present and near the front)
+    if combined_rows:
+        # ensure every row has the same keys
+        base_keys = list(combined_rows[0].keys())
+        base_set = set(base_keys)
+        for r in combined_rows:
+            for k in base_keys:
+                r.setdefault(k, "")
+            for k in r:
+                if k not in base_set:
+                    base_set.add(k)
+                    base_keys.append(k)
+
+        # Prefer a clean order
+        preferred = [
+            "account",
+            "order_number",
+            "order_full",
+            "item_id",
+            "title",
+            "item_url",
+            "qty_sold",
+            "qty_available",
+            "price",
+            "price_text",
+        ]
+        # Append any unknown keys at end
+        headers = [h for h in preferred if h in base_keys] + [h for h in base_keys if h not in preferred]
+    else:
+        headers = ["account", "order_number", "order_full", "item_id", "title", "item_url", "qty_sold", "qty_available", "price", "price_text"]
 
-        driver.get(url)
-        ensure_logged_in_or_pause(driver)
-        driver.get(url)
+    # Output CSV name reflects filter + which page
+    page_tag = "all_orders" if all_orders else "awaiting_shipment"
+    manual_tag = "items" if not args.no_manual_filter else "all_items"
+    csv_name = f"{page_tag}_{manual_tag}.csv" if args.account == "both" else f"{page_tag}_{manual_tag}_{args.account}.csv"
+    out_csv = out_dir / csv_name
 
-        rows = scrape_orders(driver, timeout=args.timeout, max_items=args.max_items, debug=args.debug)
-        rows = filter_out_phantom_rows(rows)
+    # Console output
+    print()
+    if args.stdout_short:
+        short_headers = ["account", "item_id", "title"]
+        print_table(combined_rows, headers=short_headers, max_widths={"title": 90})
+    else:
+        print_table(combined_rows, headers=headers, max_widths={"title": 60, "item_url": 60, "price_text": 40})
+
+    # Write CSV
+    write_csv(combined_rows, out_csv, headers=headers)
+
+    print(f"\nSaved CSV: {out_csv}")
+    print(f"Rows kept: {len(combined_rows)}")
+    #if not args.no_manual_filter:
+    #    print("Filter applied: title contains 'manual' (case-insensitive).")
+    #else:
+    #    print("Filter disabled: keeping all titles.")
 
-        # Add account column for downstream scripts / traceability
-        for r in rows:
-            r["account"] = account.name
 
-        # Keep only manuals (default)
-        rows = filter_rows_by_manual(rows, enabled=not args.no_manual_filter)
+def run_daemon(accounts: list[AccountSpec], args, out_dir: Path):
+    """
+    Keep one Chrome per account alive and re-scrape on demand, so repeated runs
+    skip driver startup and sign-in. Commands on stdin: ALL, AWAITING, QUIT.
+    """
+    drivers = []
+    try:
+        for acc in accounts:
+            drivers.append(build_driver(acc.profile_dir, headless=args.headless, chrome_binary=args.chrome_binary))
+
+        all_orders = args.all_orders
+        while True:
+            url = ALL_ORDERS_URL if all_orders else AWAITING_URL
+            combined_rows: list[dict] = []
+            for acc, driver in zip(accounts, drivers):
+                # keep the daemon (and the other sessions) alive if one scrape fails;
+                # headless has no window to sign in to, so skip instead of pausing
+                try:
+                    combined_rows.extend(scrape_with_driver(driver, acc, url, args, interactive=not args.headless))
+                except WebDriverException as exc:
+                    print(f"[{acc.name}] scrape failed: {exc.msg or type(exc).__name__}")
+            emit_results(combined_rows, args, all_orders, out_dir)
 
-        return rows
+            while True:
+                try:
+                    cmd = input("\nCommand [ALL / AWAITING / QUIT]: ").strip().upper()
+                except EOFError:
+                    cmd = "QUIT"
+                if cmd in ("ALL", "AWAITING", "QUIT"):
+                    break
+                print(f"Unknown command: {cmd!r}")
+
+            if cmd == "QUIT":
+                return
+            all_orders = cmd == "ALL"
     finally:
-        driver.quit()
+        for driver in drivers:
+            driver.quit()
 
 
 def main():
@@ -372,6 +547,10 @@ def main():
     ap.add_argument("--no-manual-filter", action="store_true",
                     help="Disable the default filter that keeps only items with 'manual' in the title.")
 
+    # keep the browsers open and re-scrape on command (amortizes Chrome startup)
+    ap.add_argument("--daemon", action="store_true",
+                    help="After scraping, keep Chrome open and read ALL / AWAITING / QUIT from stdin.")
+
     args = ap.parse_args()
 
     url = ALL_ORDERS_URL if args.all_orders else AWAITING_URL
@@ -395,68 +574,25 @@ def main():
     else:
         pass  # both
 
-    combined_rows: list[dict] = []
-    for acc in accounts:
-        rows = scrape_account(acc, url, args)
-        combined_rows.extend(rows)
-
-    # stable column order for CSV output
-    # (ensure "account" is present and near the front)
-    if combined_rows:
-        # ensure every row has the same keys
-        base_keys = list(combined_rows[0].keys())
-        for r in combined_rows:
-            for k in base_keys:
-                r.setdefault(k, "")
-            for k in list(r.keys()):
-                if k not in base_keys:
-                    base_keys.append(k)
-
-        # Prefer a clean order
-        preferred = [
-            "account",
-            "order_number",
-            "order_full",
-            "item_id",
-            "title",
-            "item_url",
-            "qty_sold",
-            "qty_available",
-            "price",
-            "price_text",
-        ]
-        # Append any unknown keys at end
-        headers = [h for h in preferred if h in base_keys] + [h for h in base_keys if h not in preferred]
-    else:
-        headers = ["account", "order_number", "order_full", "item_id", "title", "item_url", "qty_sold", "qty_available", "price", "price_text"]
-
-    # Output CSV name reflects filter + which page
-    page_tag = "all_orders" if args.all_orders else "awaiting_shipment"
-    manual_tag = "items" if not args.no_manual_filter else "all_items"
-    csv_name = f"{page_tag}_{manual_tag}.csv" if args.account == "both" else f"{page_tag}_{manual_tag}_{args.account}.csv"
-    out_csv = out_dir / csv_name
+    if args.daemon:
+        run_daemon(accounts, args, out_dir)
+        return
 
-    # Console output
-    print()
-    if args.stdout_short:
-        short_headers = ["account", "item_id", "title"]
-        print_table(combined_rows, headers=short_headers, max_widths={"title": 90})
+    combined_rows: list[dict] = []
+    if args.headless and len(accounts) > 1:
+        # Each account has its own profile dir and Chrome, so they can run side by side.
+        # Selenium is not thread-safe, hence processes. Only when headless: a visible
+        # run may need the sign-in pause, which reads from this console. Workers have
+        # no stdin, so an expired session skips that account instead of pausing.
+        with ProcessPoolExecutor(max_workers=len(accounts)) as ex:
+            for rows in ex.map(partial(scrape_account, url=url, args=args, interactive=False), accounts):
+                combined_rows.extend(rows)
     else:
-        print_table(combined_rows, headers=headers, max_widths={"title": 60, "item_url": 60, "price_text": 40})
+        for acc in accounts:
+            rows = scrape_account(acc, url, args)
+            combined_rows.extend(rows)
 
-    # Write CSV
-    if combined_rows:
-        with out_csv.open("w", newline="", encoding="utf-8") as f:
-            w = csv.DictWriter(f, fieldnames=headers)
-            w.writeheader()
-            w.writerows(combined_rows)
-
-    print(f"\nSaved CSV: {out_csv}")
-    print(f"Rows kept: {len(combined_rows)}")
-    #if not args.no_manual_filter:
-    #    print("Filter applied: title contains 'manual' (case-insensitive).")
-    #else:
-    #    print("Filter disabled: keeping all titles.")
+    emit_results(combined_rows, args, args.all_orders, out_dir)
 
     # NOTE: unlike your earlier version, we do not pause at the end,
     # because we may have scraped multiple accounts and always quit drivers.